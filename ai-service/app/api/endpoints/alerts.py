@@ -0,0 +1,23 @@
+from fastapi import APIRouter, Request
+from app.models.schemas import AlertRequest
+
+router = APIRouter()
+
+
+@router.post("/alerts")
+async def send_alert(alert: AlertRequest, request: Request):
+    """Queue a signal alert; delivery is batched and asynchronous"""
+    dispatcher = request.app.state.alert_dispatcher
+    signal_data = alert.model_dump(exclude={"recipients"})
+    queued = [r for r in alert.recipients if dispatcher.submit(r, signal_data)]
+    return {"status": "queued", "queued": queued}
+
+
+@router.get("/alerts/metrics")
+async def alert_metrics(request: Request):
+    dispatcher = request.app.state.alert_dispatcher
+    return {
+        **dispatcher.metrics,
+        "outbox_depth": dispatcher.outbox.qsize(),
+        "pending_recipients": len(dispatcher.pending),
+    }
@@ -1,13 +1,35 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, HTTPException, Request
+from app.models.schemas import BarRangeQuery
 import pandas as pd
 import numpy as np
 
 router = APIRouter()
 
-@router.post("/backtest")
-async def backtest_strategy(prices: list):
-    df = pd.DataFrame(prices, columns=["price"])
+
+def _backtest(prices) -> dict:
+    df = pd.DataFrame({"price": prices}, copy=False)
     df["returns"] = df["price"].pct_change()
     total_return = (df["price"].iloc[-1] - df["price"].iloc[0]) / df["price"].iloc[0]
     sharpe = df["returns"].mean() / (df["returns"].std() + 1e-6) * np.sqrt(252)
     return {"total_return": total_return, "sharpe_ratio": sharpe}
+
+
+@router.post("/backtest")
+async def backtest_strategy(prices: list):
+    return _backtest(prices)
+
+
+@router.post("/backtest/range")
+async def backtest_range(query: BarRangeQuery, request: Request):
+    """Backtest each symbol over a date range read from the bar store"""
+    bar_store = request.app.state.bar_store
+    try:
+        data = bar_store.query(query.symbols, query.start, query.end, ["price"])
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    results = {}
+    for symbol, columns in data.items():
+        if len(columns["price"]) < 2:
+            raise HTTPException(status_code=404, detail=f"Not enough bars for {symbol}")
+        results[symbol] = _backtest(columns["price"])
+    return results
@@ -0,0 +1,45 @@
+from fastapi import APIRouter, HTTPException, Request
+from typing import List
+import numpy as np
+from app.models.schemas import MarketDataPoint, BarRangeQuery
+
+router = APIRouter()
+
+
+def _to_json(values: np.ndarray) -> list:
+    """Missing optional fields are stored as NaN, which JSON cannot carry"""
+    if values.dtype.kind != "f":
+        return values.tolist()
+    out = values.astype(object)
+    out[np.isnan(values)] = None
+    return out.tolist()
+
+
+@router.post("/bars")
+async def ingest_bars(bars: List[MarketDataPoint], request: Request):
+    """Append bars to the local historical store"""
+    bar_store = request.app.state.bar_store
+    try:
+        written = bar_store.append(bars)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"status": "ok", "written": written}
+
+
+@router.get("/bars/symbols")
+async def list_symbols(request: Request):
+    bar_store = request.app.state.bar_store
+    return {symbol: bar_store.partitions(symbol) for symbol in bar_store.symbols()}
+
+
+@router.post("/bars/query")
+async def query_bars(query: BarRangeQuery, request: Request):
+    bar_store = request.app.state.bar_store
+    try:
+        data = bar_store.query(query.symbols, query.start, query.end, query.columns)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {
+        symbol: {column: _to_json(values) for column, values in columns.items()}
+        for symbol, columns in data.items()
+    }
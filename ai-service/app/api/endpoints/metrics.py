@@ -0,0 +1,10 @@
+from fastapi import APIRouter
+from app.core.admission import controllers
+
+router = APIRouter()
+
+
+@router.get("/metrics/admission")
+async def admission_metrics():
+    """Queue depth, per-tier latency and shed/degradation counters per endpoint"""
+    return {name: controller.stats() for name, controller in controllers.items()}
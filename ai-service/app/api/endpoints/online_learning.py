@@ -0,0 +1,26 @@
+from fastapi import APIRouter, Request
+from typing import List
+from app.models.schemas import MarketDataPoint
+
+router = APIRouter()
+
+
+@router.post("/online/ticks")
+async def ingest_ticks(ticks: List[MarketDataPoint], request: Request):
+    """Feed live bars to the incremental learner"""
+    online_service = request.app.state.online_service
+    matured = online_service.ingest(ticks)
+    return {"status": "ok", "received": len(ticks), "matured": matured}
+
+
+@router.post("/online/publish")
+async def publish_snapshot(request: Request):
+    """Publish the current online model immediately instead of waiting for the schedule"""
+    online_service = request.app.state.online_service
+    await online_service.publish()
+    return online_service.status()
+
+
+@router.get("/online/status")
+async def online_status(request: Request):
+    return request.app.state.online_service.status()
@@ -1,5 +1,7 @@
-from fastapi import APIRouter, BackgroundTasks, HTTPException
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Request
+from app.models.schemas import BarRangeQuery
 from app.services.rl_service import RLService
+from app.services.bar_store import COLUMNS
 import uuid
 from typing import List
 import numpy as np
@@ -7,20 +9,63 @@ import numpy as np
 router = APIRouter()
 rl_jobs = {}
 
-@router.post("/train-rl")
-async def train_rl(training_data: List[List[float]], background_tasks: BackgroundTasks):
-    """Start RL training job in background"""
+def _queue_job(env_data, background_tasks: BackgroundTasks) -> dict:
     job_id = str(uuid.uuid4())
     rl_jobs[job_id] = {"status": "queued"}
 
     def _train():
         rl_service = RLService()
-        result = rl_service.train_agent(np.array(training_data))
+        result = rl_service.train_agent(env_data(rl_service))
         rl_jobs[job_id].update({"status": "completed", "result": result})
 
     background_tasks.add_task(_train)
     return {"job_id": job_id, "status": "queued"}
 
+
+@router.post("/train-rl")
+async def train_rl(training_data: List[List[float]], background_tasks: BackgroundTasks):
+    """Start RL training job in background"""
+    return _queue_job(lambda _: np.array(training_data), background_tasks)
+
+
+@router.post("/train-rl/range")
+async def train_rl_range(
+    query: BarRangeQuery, request: Request, background_tasks: BackgroundTasks
+):
+    """Start RL training on one symbol's bars from the store.
+
+    Each state row holds the requested columns (price first, as the reward
+    expects) zero-padded to the agent's input size. The range is read and
+    validated before the job is queued.
+    """
+    if len(query.symbols) != 1:
+        raise HTTPException(status_code=400, detail="RL training takes one symbol")
+    columns = query.columns or ["price", "volume", "change", "changePercent"]
+    columns = ["price"] + [c for c in columns if c != "price"]
+    unknown = set(columns) - (set(COLUMNS) - {"timestamp"})
+    if unknown:
+        raise HTTPException(
+            status_code=400, detail=f"Unsupported state columns: {sorted(unknown)}"
+        )
+
+    bar_store = request.app.state.bar_store
+    try:
+        data = bar_store.read(query.symbols[0], query.start, query.end, columns)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if len(data["price"]) < 2:
+        raise HTTPException(
+            status_code=404, detail=f"Not enough bars for {query.symbols[0]}"
+        )
+
+    def _load(rl_service: RLService):
+        env_data = np.zeros((len(data["price"]), rl_service.agent.fc1.in_features))
+        for i, column in enumerate(columns):
+            env_data[:, i] = np.nan_to_num(data[column])
+        return env_data
+
+    return _queue_job(_load, background_tasks)
+
 @router.get("/rl-status/{job_id}")
 async def rl_status(job_id: str):
     job = rl_jobs.get(job_id)
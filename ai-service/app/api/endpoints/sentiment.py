@@ -2,6 +2,8 @@
 from fastapi import APIRouter, HTTPException, Request
 from app.models.schemas import SentimentRequest, SentimentResponse
 from app.services.sentiment_service import SentimentService
+from app.core.admission import AdmissionController
+from app.core.config import settings
 from datetime import datetime
 import logging
 
@@ -9,32 +11,45 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+admission = AdmissionController(
+    "sentiment-analysis",
+    tiers=[[], ["rule_based"]],
+    default_deadline_ms=settings.SENTIMENT_DEADLINE_MS,
+)
+
 
 @router.post("/sentiment-analysis", response_model=SentimentResponse)
 async def analyze_sentiment(request: SentimentRequest, http_request: Request):
     """
     Analyze sentiment of financial text (news, social media, earnings calls)
     """
-    try:
-        # In a real implementation, we'd get this from app state
-        # For now, create a new service instance
-        sentiment_service = SentimentService()
-        await sentiment_service.initialize_models()
-
-        # Analyze sentiment
-        sentiment_data = await sentiment_service.analyze_sentiment(
-            text=request.text, source=request.source or "news"
-        )
-
-        return SentimentResponse(
-            sentiment=sentiment_data["sentiment"],
-            score=sentiment_data["score"],
-            confidence=sentiment_data["confidence"],
-            key_phrases=sentiment_data["key_phrases"],
-        )
-
-    except Exception as e:
-        logger.error(f"Error in sentiment analysis: {str(e)}")
-        raise HTTPException(
-            status_code=500, detail=f"Error processing sentiment analysis: {str(e)}"
-        )
+    async with admission.admit(http_request) as ticket:
+        try:
+            # In a real implementation, we'd get this from app state
+            # For now, create a new service instance
+            sentiment_service = SentimentService()
+
+            # Under load skip loading FinBERT and use the rule-based model
+            if ticket.degraded("rule_based"):
+                sentiment_data = await sentiment_service._rule_based_analysis(
+                    request.text
+                )
+            else:
+                await sentiment_service.initialize_models()
+                sentiment_data = await sentiment_service.analyze_sentiment(
+                    text=request.text, source=request.source or "news"
+                )
+
+            return SentimentResponse(
+                sentiment=sentiment_data["sentiment"],
+                score=sentiment_data["score"],
+                confidence=sentiment_data["confidence"],
+                key_phrases=sentiment_data["key_phrases"],
+                degradations=ticket.record(ticket.degradations),
+            )
+
+        except Exception as e:
+            logger.error(f"Error in sentiment analysis: {str(e)}")
+            raise HTTPException(
+                status_code=500, detail=f"Error processing sentiment analysis: {str(e)}"
+            )
@@ -2,16 +2,35 @@
 from fastapi import APIRouter, Request
 from typing import List, Dict, Any
 from app.models.schemas import MarketDataPoint
+from app.core.admission import AdmissionController
+from app.core.config import settings
 import logging
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+admission = AdmissionController(
+    "trading-signal",
+    tiers=[[], ["skip_explanation"], ["skip_explanation", "cached_result"]],
+    default_deadline_ms=settings.TRADING_SIGNAL_DEADLINE_MS,
+)
+
 @router.post("/trading-signal")
 async def trading_signal(symbols: List[str], request: Request):
     ml_service = request.app.state.ml_service
     results = {}
-    for symbol in symbols:
-        historical_data = ...  # fetch historical data for symbol
-        results[symbol] = await ml_service.predict_trading_signal(historical_data)
+    async with admission.admit(request, units=len(symbols)) as ticket:
+        for symbol in symbols:
+            historical_data = ...  # fetch historical data for symbol
+            result = await ml_service.predict_trading_signal(
+                historical_data,
+                explain=not ticket.degraded("skip_explanation"),
+                allow_stale=ticket.degraded("cached_result"),
+            )
+            # Tag only what was actually applied: "cached_result" means a stale hit
+            stale = result.pop("stale", False)
+            result["degradations"] = ticket.record(
+                [tag for tag in ticket.degradations if tag != "cached_result" or stale]
+            )
+            results[symbol] = result
     return results
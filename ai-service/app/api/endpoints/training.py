@@ -1,8 +1,11 @@
 # ai-service/app/api/endpoints/train_model.py
 
-from fastapi import APIRouter, HTTPException, BackgroundTasks
+from fastapi import APIRouter, HTTPException, BackgroundTasks, Request
 from app.models.schemas import TrainingRequest, TrainingResponse
 from app.services import training_service
+from app.core.config import settings
+from typing import Dict, Optional
+import numpy as np
 import uuid
 import logging
 from datetime import datetime
@@ -17,9 +20,17 @@ router = APIRouter()
 training_jobs = {}
 
 
-async def train_model_async(job_id: str, training_data: list, parameters: dict):
+async def train_model_async(
+    job_id: str,
+    training_data: list,
+    parameters: dict,
+    stored_data: Optional[Dict[str, Dict[str, np.ndarray]]] = None,
+    ml_service=None,
+):
     """
     Background task for model training using training_service.
+    stored_data holds bar-store columns; features and the forward-return
+    target are derived from them instead of the payload.
     """
     try:
         # Initialize job status
@@ -30,8 +41,11 @@ async def train_model_async(job_id: str, training_data: list, parameters: dict):
             "parameters": parameters,
         }
 
-        # Convert list of dicts to pandas DataFrame
-        df = pd.DataFrame(training_data)
+        # Convert list of dicts (or stored bar columns) to pandas DataFrame
+        if stored_data is not None:
+            df = await asyncio.to_thread(ml_service.build_training_frame, stored_data)
+        else:
+            df = pd.DataFrame(training_data)
         target_column = parameters.get("target_column", "target")
 
         # Step 1: Preprocessing
@@ -61,11 +75,49 @@ async def train_model_async(job_id: str, training_data: list, parameters: dict):
         logger.error(f"Training job {job_id} failed: {e}")
 
 
+def _load_stored_data(request: TrainingRequest, http_request: Request) -> dict:
+    """Read and validate a data_range before the job is queued"""
+    target_column = request.parameters.get("target_column", "target")
+    if target_column != "target":
+        raise HTTPException(
+            status_code=400,
+            detail="data_range jobs train on the derived forward-return 'target'",
+        )
+
+    query = request.data_range
+    try:
+        data = http_request.app.state.bar_store.query(
+            query.symbols, query.start, query.end, ["price", "volume"]
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    min_bars = settings.LOOKBACK_WINDOW + settings.PREDICTION_HORIZON
+    data = {s: c for s, c in data.items() if len(c["price"]) >= min_bars}
+    if not data:
+        raise HTTPException(
+            status_code=404,
+            detail=f"No symbol has the {min_bars} bars needed for one labelled window",
+        )
+    return data
+
+
 @router.post("/train-model", response_model=TrainingResponse)
-async def train_model(request: TrainingRequest, background_tasks: BackgroundTasks):
+async def train_model(
+    request: TrainingRequest, background_tasks: BackgroundTasks, http_request: Request
+):
     """
     Start a new model training job (Reinforcement Learning or supervised learning)
     """
+    if not request.training_data and request.data_range is None:
+        raise HTTPException(
+            status_code=400, detail="Provide either training_data or data_range"
+        )
+
+    stored_data = None
+    if request.data_range is not None:
+        stored_data = _load_stored_data(request, http_request)
+
     try:
         job_id = str(uuid.uuid4())
 
@@ -79,7 +131,12 @@ async def train_model(request: TrainingRequest, background_tasks: BackgroundTask
 
         # Start background training task
         background_tasks.add_task(
-            train_model_async, job_id, request.training_data, request.parameters
+            train_model_async,
+            job_id,
+            request.training_data,
+            request.parameters,
+            stored_data,
+            http_request.app.state.ml_service,
         )
 
         return TrainingResponse(
@@ -0,0 +1,181 @@
+import asyncio
+import logging
+import math
+import time
+from collections import Counter
+from contextlib import asynccontextmanager
+from typing import Dict, List
+
+from fastapi import HTTPException, Request
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# endpoint name -> controller, for the metrics endpoint
+controllers: Dict[str, "AdmissionController"] = {}
+
+
+class Ticket:
+    """Admission result handed to the endpoint: which degradations are active"""
+
+    def __init__(self, degradations: List[str], deadline: float, metrics: Counter):
+        self.degradations = degradations
+        self.deadline = deadline
+        self._metrics = metrics
+
+    def degraded(self, tag: str) -> bool:
+        return tag in self.degradations
+
+    def record(self, applied: List[str]) -> List[str]:
+        """Count the degradations actually applied and return them for the response"""
+        for tag in applied:
+            self._metrics[tag] += 1
+        return applied
+
+
+class AdmissionController:
+    """Per-endpoint bounded queue with deadline-driven degradation.
+
+    ``tiers`` lists the degradations for each level, full treatment first and
+    cheapest last, e.g.
+    ``[[], ["skip_explanation"], ["skip_explanation", "cached_result"]]``.
+
+    Degradation is driven by load only: a request that got a slot without
+    queueing, with nobody queued behind it, always gets full treatment (which
+    also keeps that tier's estimate fresh). Otherwise the first tier whose
+    observed service time (EWMA) fits what is left of its deadline is used, or
+    the cheapest tier if none fit. Estimates not refreshed for
+    ``stale_after`` seconds are forgotten, so a tier that was slow once is
+    tried again.
+
+    Requests are shed with 429 and a Retry-After estimated from the backlog
+    when the queue is full, when the estimated queue wait already exceeds
+    their deadline on arrival, or when the deadline runs out while they are
+    queued; a request never waits past its deadline.
+
+    The deadline comes from the ``X-Deadline-Ms`` header; missing,
+    non-numeric or non-positive values fall back to the endpoint default.
+    ``units`` lets a request doing N independent pieces of work (e.g. one
+    prediction per symbol) be estimated and recorded per piece.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        tiers: List[List[str]],
+        default_deadline_ms: float,
+        max_concurrency: int = settings.ADMISSION_MAX_CONCURRENCY,
+        max_queue: int = settings.ADMISSION_MAX_QUEUE,
+        ewma_alpha: float = 0.2,
+        stale_after: float = settings.ADMISSION_STALE_AFTER,
+    ):
+        self.name = name
+        self.tiers = tiers
+        self.default_deadline_ms = default_deadline_ms
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.ewma_alpha = ewma_alpha
+        self.stale_after = stale_after
+
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.waiting = 0
+        self.in_flight = 0
+        self.service_time = [0.0] * len(tiers)  # EWMA seconds per tier
+        self.observed_at = [0.0] * len(tiers)
+        self.metrics: Counter = Counter()
+        controllers[name] = self
+
+    def _deadline_ms(self, request: Request) -> float:
+        header = request.headers.get(settings.ADMISSION_DEADLINE_HEADER)
+        if header:
+            try:
+                deadline_ms = float(header)
+            except ValueError:
+                deadline_ms = 0.0
+            if deadline_ms > 0 and math.isfinite(deadline_ms):
+                return deadline_ms
+        return self.default_deadline_ms
+
+    def _estimated_wait(self) -> float:
+        per_request = self.service_time[0] or max(self.service_time)
+        return (self.waiting + 1) * per_request / self.max_concurrency
+
+    def _pick_tier(
+        self, contended: bool, now: float, remaining: float, units: int
+    ) -> int:
+        if not contended and self.waiting == 0:
+            return 0
+        for level, observed in enumerate(self.service_time):
+            if now - self.observed_at[level] > self.stale_after:
+                self.service_time[level] = 0.0
+            if self.service_time[level] * units <= remaining:
+                return level
+        return len(self.tiers) - 1
+
+    def _record(self, level: int, elapsed: float):
+        previous = self.service_time[level]
+        self.service_time[level] = (
+            elapsed
+            if previous == 0.0
+            else self.ewma_alpha * elapsed + (1 - self.ewma_alpha) * previous
+        )
+        self.observed_at[level] = time.monotonic()
+
+    def _shed(self, reason: str, detail: str):
+        self.metrics["shed"] += 1
+        self.metrics[f"shed_{reason}"] += 1
+        retry_after = max(1, math.ceil(self._estimated_wait()))
+        raise HTTPException(
+            status_code=429,
+            detail=detail,
+            headers={"Retry-After": str(retry_after)},
+        )
+
+    @asynccontextmanager
+    async def admit(self, request: Request, units: int = 1):
+        arrived = time.monotonic()
+        budget = self._deadline_ms(request) / 1000
+        deadline = arrived + budget
+        units = max(1, units)
+
+        if self.waiting >= self.max_queue:
+            self._shed("queue_full", f"{self.name} is overloaded, retry later")
+
+        contended = self.semaphore.locked()
+        if contended and self._estimated_wait() > budget:
+            self._shed("deadline", f"{self.name} queue wait exceeds the deadline")
+
+        self.waiting += 1
+        try:
+            await asyncio.wait_for(self.semaphore.acquire(), budget)
+        except asyncio.TimeoutError:
+            self._shed("deadline", f"{self.name} deadline expired while queued")
+        finally:
+            self.waiting -= 1
+
+        self.in_flight += 1
+        started = time.monotonic()
+        level = self._pick_tier(contended, started, deadline - started, units)
+        ticket = Ticket(list(self.tiers[level]), deadline, self.metrics)
+        self.metrics["admitted"] += 1
+        try:
+            yield ticket
+            self._record(level, (time.monotonic() - started) / units)
+        finally:
+            self.in_flight -= 1
+            self.semaphore.release()
+
+    def stats(self) -> Dict[str, object]:
+        return {
+            "in_flight": self.in_flight,
+            "waiting": self.waiting,
+            "max_concurrency": self.max_concurrency,
+            "max_queue": self.max_queue,
+            "default_deadline_ms": self.default_deadline_ms,
+            "service_time_ms": {
+                "+".join(tier) or "full": round(t * 1000, 2)
+                for tier, t in zip(self.tiers, self.service_time)
+            },
+            "counters": dict(self.metrics),
+        }
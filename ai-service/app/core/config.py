@@ -25,9 +25,43 @@ class Settings(BaseSettings):
     LOOKBACK_WINDOW: int = 50
     PREDICTION_HORIZON: int = 5
 
+    # Historical bar store
+    BAR_STORE_DIR: str = "./data/bars"
+
+    # Online (incremental) learning
+    ONLINE_MODEL_NAME: str = "trading_model_online"
+    ONLINE_QUEUE_SIZE: int = 10000
+    ONLINE_BATCH_SIZE: int = 64
+    ONLINE_PUBLISH_INTERVAL: float = 300.0
+    ONLINE_LABEL_THRESHOLD: float = 0.002
+
+    # Admission control / load shedding
+    ADMISSION_DEADLINE_HEADER: str = "X-Deadline-Ms"
+    ADMISSION_MAX_CONCURRENCY: int = 8
+    ADMISSION_MAX_QUEUE: int = 64
+    ADMISSION_STALE_AFTER: float = 30.0
+    TRADING_SIGNAL_DEADLINE_MS: float = 500.0
+    SENTIMENT_DEADLINE_MS: float = 1000.0
+
     # Redis for model caching
     REDIS_URL: str = "redis://localhost:6379"
 
+    # Email alerts
+    EMAIL_FROM: str = "alerts@tradesync.local"
+    EMAIL_SMTP_SERVER: str = "localhost"
+    EMAIL_SMTP_PORT: int = 1025
+    EMAIL_RECIPIENT: str = "test@example.com"
+    ALERT_SMTP_POOL_SIZE: int = 4
+    ALERT_QUEUE_SIZE: int = 10000
+    ALERT_COALESCE_WINDOW: float = 5.0
+    ALERT_MAX_DIGEST_SIZE: int = 100
+    ALERT_DEDUP_TTL: float = 300.0
+    ALERT_RATE_LIMIT: float = 50.0
+    ALERT_MAX_RETRIES: int = 3
+    ALERT_RETRY_BACKOFF: float = 0.5
+    ALERT_SMTP_TIMEOUT: float = 10.0
+    ALERT_SHUTDOWN_TIMEOUT: float = 30.0
+
     class Config:
         env_file = ".env"
 
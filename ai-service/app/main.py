@@ -7,18 +7,41 @@ from app.api.endpoints import trading, sentiment, training
 from app.core.config import settings
 from app.api.endpoints import rl_training
 from app.api.endpoints import model_management, backtest
+from app.api.endpoints import online_learning, bar_store
+from app.api.endpoints import metrics, alerts
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup: Load ML models
     from app.services.ml_service import MLService
+    from app.services.bar_store import BarStore
+
+    app.state.bar_store = BarStore()
 
     app.state.ml_service = MLService()
     await app.state.ml_service.initialize_models()
+
+    from app.services.online_learning_service import OnlineLearningService
+
+    app.state.online_service = OnlineLearningService(app.state.ml_service)
+    app.state.online_service.start()
+
+    from app.services.alert_service import AlertDispatcher
+
+    app.state.alert_dispatcher = AlertDispatcher(
+        {
+            "from": settings.EMAIL_FROM,
+            "smtp_server": settings.EMAIL_SMTP_SERVER,
+            "smtp_port": settings.EMAIL_SMTP_PORT,
+        }
+    )
+    await app.state.alert_dispatcher.start()
     print("🤖 AI Service started - ML models loaded")
     yield
     # Shutdown: Cleanup resources
+    await app.state.online_service.stop()
+    await app.state.alert_dispatcher.stop()
     print("🛑 AI Service shutting down")
 
 
@@ -45,6 +68,10 @@ app.include_router(training.router, prefix="/ai", tags=["training"])
 app.include_router(rl_training.router, prefix="/ai", tags=["reinforcement_learning"])
 app.include_router(model_management.router, prefix="/ai", tags=["model_management"])
 app.include_router(backtest.router, prefix="/ai", tags=["backtest"])
+app.include_router(online_learning.router, prefix="/ai", tags=["online_learning"])
+app.include_router(bar_store.router, prefix="/ai", tags=["bar_store"])
+app.include_router(metrics.router, prefix="/ai", tags=["metrics"])
+app.include_router(alerts.router, prefix="/ai", tags=["alerts"])
 
 
 @app.get("/health")
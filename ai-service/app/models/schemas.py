@@ -1,5 +1,5 @@
 # schemas.py
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 
@@ -14,6 +14,13 @@ class MarketDataPoint(BaseModel):
     changePercent: Optional[float] = None
 
 
+class BarRangeQuery(BaseModel):
+    symbols: List[str]
+    start: int = Field(..., description="Inclusive start timestamp (ms)")
+    end: int = Field(..., description="Inclusive end timestamp (ms)")
+    columns: Optional[List[str]] = None
+
+
 class TradingSignalRequest(BaseModel):
     symbol: str
     historical_data: List[MarketDataPoint]
@@ -40,13 +47,19 @@ class SentimentResponse(BaseModel):
     score: float = Field(..., ge=0.0, le=1.0, description="Sentiment intensity score")
     confidence: float = Field(..., ge=0.0, le=1.0, description="Model confidence")
     key_phrases: List[str] = Field(default_factory=list)
+    degradations: List[str] = Field(
+        default_factory=list, description="Degradations applied under load"
+    )
 
 
 # Training Schemas
 class TrainingRequest(BaseModel):
     model_type: str = "reinforcement_learning"
     parameters: Dict[str, Any]
-    training_data: List[MarketDataPoint]
+    training_data: List[MarketDataPoint] = Field(default_factory=list)
+    data_range: Optional[BarRangeQuery] = Field(
+        None, description="Load training data from the bar store instead of the payload"
+    )
 
 
 class TrainingResponse(BaseModel):
@@ -54,3 +67,21 @@ class TrainingResponse(BaseModel):
     status: str
     message: str
     metrics: Optional[Dict[str, float]] = None
+
+
+# Alert Schemas
+class AlertRequest(BaseModel):
+    recipients: List[str]
+    symbol: Optional[str] = None
+    signal: str
+    confidence: float = Field(..., ge=0.0, le=1.0)
+    reasoning: str
+    model_version: str = "1.0.0"
+
+    @field_validator("recipients")
+    @classmethod
+    def validate_recipients(cls, recipients: List[str]) -> List[str]:
+        for recipient in recipients:
+            if "\r" in recipient or "\n" in recipient or "@" not in recipient:
+                raise ValueError(f"Invalid recipient address: {recipient!r}")
+        return recipients
@@ -1,26 +1,59 @@
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
+import asyncio
 import logging
 import smtplib
+import time
+from collections import Counter, OrderedDict
 from email.message import EmailMessage
+from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+
+def _format_signal(signal_data: Dict[str, Any]) -> str:
+    return f"""
+        Signal: {signal_data['signal']}
+        Confidence: {signal_data['confidence']:.1%}
+        Reasoning: {signal_data['reasoning']}
+        Model Version: {signal_data['model_version']}
+        """
+
+
+def build_alert_message(
+    sender: str, recipient: str, alerts: List[Dict[str, Any]]
+) -> EmailMessage:
+    """One alert becomes a plain alert email; several become a digest"""
+    msg = EmailMessage()
+    msg["From"] = sender
+    msg["To"] = recipient
+    if len(alerts) == 1:
+        msg["Subject"] = f"Trading Alert: {alerts[0]['signal']}"
+        msg.set_content(_format_signal(alerts[0]))
+        return msg
+
+    msg["Subject"] = f"Trading Alert Digest: {len(alerts)} signals"
+    sections = []
+    for signal_data in alerts:
+        header = signal_data.get("symbol") or signal_data["signal"]
+        sections.append(f"{header}:{_format_signal(signal_data)}")
+    msg.set_content("\n".join(sections))
+    return msg
+
+
+def _is_permanent(error: Exception) -> bool:
+    """5xx replies (e.g. refused recipients) will fail again, so are not retried"""
+    if isinstance(error, smtplib.SMTPRecipientsRefused):
+        return True
+    return isinstance(error, smtplib.SMTPResponseException) and error.smtp_code >= 500
+
+
 class AlertService:
     """Send alerts based on trading signals"""
     def __init__(self, email_config: Dict[str, str]):
         self.email_config = email_config
 
     def send_alert(self, recipient: str, signal_data: Dict[str, Any]):
-        msg = EmailMessage()
-        msg["Subject"] = f"Trading Alert: {signal_data['signal']}"
-        msg["From"] = self.email_config["from"]
-        msg["To"] = recipient
-        msg.set_content(f"""
-        Signal: {signal_data['signal']}
-        Confidence: {signal_data['confidence']:.1%}
-        Reasoning: {signal_data['reasoning']}
-        Model Version: {signal_data['model_version']}
-        """)
+        msg = build_alert_message(self.email_config["from"], recipient, [signal_data])
 
         try:
             with smtplib.SMTP(self.email_config["smtp_server"], self.email_config["smtp_port"]) as smtp:
@@ -28,3 +61,222 @@ class AlertService:
             logger.info(f"Alert sent to {recipient}")
         except Exception as e:
             logger.error(f"Failed to send alert: {e}")
+
+
+class AlertDispatcher:
+    """Asynchronous alert delivery over a pool of persistent SMTP connections.
+
+    ``submit`` never blocks: repeated signals (same recipient, symbol and
+    signal within ``dedup_ttl``) are dropped, and the rest are held per
+    recipient for ``coalesce_window`` seconds and sent as one digest. Each of
+    the ``pool_size`` workers owns a long-lived SMTP connection that is
+    reopened only after a failure (an idle disconnect is reopened at once
+    without using a retry); sends share a token-bucket rate limit and
+    are retried with exponential backoff unless the server rejects them
+    permanently. Alerts that are dropped or fail release their dedup entry so
+    the same signal can be sent again.
+    """
+
+    def __init__(
+        self,
+        email_config: Dict[str, str],
+        pool_size: int = settings.ALERT_SMTP_POOL_SIZE,
+        queue_size: int = settings.ALERT_QUEUE_SIZE,
+        coalesce_window: float = settings.ALERT_COALESCE_WINDOW,
+        max_digest_size: int = settings.ALERT_MAX_DIGEST_SIZE,
+        dedup_ttl: float = settings.ALERT_DEDUP_TTL,
+        rate_limit: float = settings.ALERT_RATE_LIMIT,
+        max_retries: int = settings.ALERT_MAX_RETRIES,
+        retry_backoff: float = settings.ALERT_RETRY_BACKOFF,
+        smtp_timeout: float = settings.ALERT_SMTP_TIMEOUT,
+        shutdown_timeout: float = settings.ALERT_SHUTDOWN_TIMEOUT,
+    ):
+        self.email_config = email_config
+        self.pool_size = pool_size
+        self.coalesce_window = coalesce_window
+        self.max_digest_size = max_digest_size
+        self.dedup_ttl = dedup_ttl
+        self.rate_limit = rate_limit
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.smtp_timeout = smtp_timeout
+        self.shutdown_timeout = shutdown_timeout
+
+        self.outbox: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.pending: Dict[str, List[Dict[str, Any]]] = {}
+        self._flush_timers: Dict[str, asyncio.TimerHandle] = {}
+        # dedup key -> expiry; insertion order == expiry order since the TTL is fixed
+        self._seen: "OrderedDict[tuple, float]" = OrderedDict()
+        self._tokens = rate_limit
+        self._last_refill = time.monotonic()
+        self._workers: List[asyncio.Task] = []
+        self._in_flight = 0
+        self.metrics: Counter = Counter()
+
+    async def start(self):
+        if not self._workers:
+            self._workers = [
+                asyncio.create_task(self._worker()) for _ in range(self.pool_size)
+            ]
+            logger.info(f"Alert dispatcher started with {self.pool_size} SMTP connections")
+
+    async def stop(self):
+        """Flush everything still pending, wait up to ``shutdown_timeout`` for
+        delivery, then close connections. Alerts still queued or in flight at
+        that point are counted as undelivered."""
+        for recipient in list(self.pending):
+            self._flush(recipient)
+        try:
+            await asyncio.wait_for(self.outbox.join(), self.shutdown_timeout)
+        except asyncio.TimeoutError:
+            undelivered = self._in_flight
+            while not self.outbox.empty():
+                _, alerts = self.outbox.get_nowait()
+                self.outbox.task_done()
+                undelivered += len(alerts)
+            self.metrics["undelivered"] += undelivered
+            logger.error(f"Alert dispatcher stopped with {undelivered} undelivered alerts")
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        logger.info("Alert dispatcher stopped")
+
+    def submit(self, recipient: str, signal_data: Dict[str, Any]) -> bool:
+        """Queue an alert for delivery; returns False if it was a duplicate"""
+        self.metrics["submitted"] += 1
+        now = time.monotonic()
+        while self._seen and next(iter(self._seen.values())) <= now:
+            self._seen.popitem(last=False)
+
+        key = self._dedup_key(recipient, signal_data)
+        if key in self._seen:
+            self.metrics["deduplicated"] += 1
+            return False
+        self._seen[key] = now + self.dedup_ttl
+
+        alerts = self.pending.setdefault(recipient, [])
+        alerts.append(signal_data)
+        if len(alerts) >= self.max_digest_size:
+            self._flush(recipient)
+        elif recipient not in self._flush_timers:
+            self._flush_timers[recipient] = asyncio.get_running_loop().call_later(
+                self.coalesce_window, self._flush, recipient
+            )
+        return True
+
+    @staticmethod
+    def _dedup_key(recipient: str, signal_data: Dict[str, Any]) -> tuple:
+        return (recipient, signal_data.get("symbol"), signal_data["signal"])
+
+    def _forget(self, recipient: str, alerts: List[Dict[str, Any]]):
+        for signal_data in alerts:
+            self._seen.pop(self._dedup_key(recipient, signal_data), None)
+
+    def _flush(self, recipient: str):
+        timer = self._flush_timers.pop(recipient, None)
+        if timer is not None:
+            timer.cancel()
+        alerts = self.pending.pop(recipient, None)
+        if not alerts:
+            return
+        try:
+            self.outbox.put_nowait((recipient, alerts))
+        except asyncio.QueueFull:
+            self.metrics["dropped"] += len(alerts)
+            self._forget(recipient, alerts)
+            logger.error(f"Alert outbox full, dropped {len(alerts)} alerts for {recipient}")
+
+    async def _acquire_token(self):
+        if self.rate_limit <= 0:
+            return
+        while True:
+            now = time.monotonic()
+            self._tokens = min(
+                self.rate_limit, self._tokens + (now - self._last_refill) * self.rate_limit
+            )
+            self._last_refill = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return
+            await asyncio.sleep((1 - self._tokens) / self.rate_limit)
+
+    def _connect(self) -> smtplib.SMTP:
+        return smtplib.SMTP(
+            self.email_config["smtp_server"],
+            self.email_config["smtp_port"],
+            timeout=self.smtp_timeout,
+        )
+
+    @staticmethod
+    def _close(smtp: Optional[smtplib.SMTP]):
+        if smtp is None:
+            return
+        try:
+            smtp.quit()
+        except Exception:
+            smtp.close()
+
+    async def _deliver(
+        self, smtp: Optional[smtplib.SMTP], recipient: str, alerts: List[Dict[str, Any]]
+    ) -> Optional[smtplib.SMTP]:
+        """Send one digest with retries; returns the connection to keep pooling"""
+        msg = build_alert_message(self.email_config["from"], recipient, alerts)
+        attempt = 0
+        free_reconnect = True
+        while True:
+            await self._acquire_token()
+            reused = smtp is not None
+            try:
+                if smtp is None:
+                    smtp = await asyncio.to_thread(self._connect)
+                await asyncio.to_thread(smtp.send_message, msg)
+                self.metrics["messages_sent"] += 1
+                self.metrics["alerts_sent"] += len(alerts)
+                return smtp
+            except (smtplib.SMTPException, OSError) as e:
+                permanent = _is_permanent(e)
+                if not permanent:
+                    # The connection may be broken; reopen on retry
+                    await asyncio.to_thread(self._close, smtp)
+                    smtp = None
+                if (
+                    reused
+                    and free_reconnect
+                    and isinstance(e, smtplib.SMTPServerDisconnected)
+                ):
+                    # The server dropped an idle pooled connection; not a real failure
+                    free_reconnect = False
+                    self.metrics["reconnects"] += 1
+                    continue
+                if permanent or attempt == self.max_retries:
+                    self.metrics["failed"] += len(alerts)
+                    self._forget(recipient, alerts)
+                    logger.error(f"Failed to send alert to {recipient!r}: {e}")
+                    return smtp
+                self.metrics["retries"] += 1
+                await asyncio.sleep(self.retry_backoff * 2**attempt)
+                attempt += 1
+
+    async def _worker(self):
+        smtp: Optional[smtplib.SMTP] = None
+        try:
+            while True:
+                recipient, alerts = await self.outbox.get()
+                self._in_flight += len(alerts)
+                try:
+                    smtp = await self._deliver(smtp, recipient, alerts)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    # Never let one bad job take a pooled worker down
+                    await asyncio.to_thread(self._close, smtp)
+                    smtp = None
+                    self.metrics["failed"] += len(alerts)
+                    self._forget(recipient, alerts)
+                    logger.error(f"Failed to send alert to {recipient!r}: {e}")
+                finally:
+                    self._in_flight -= len(alerts)
+                    self.outbox.task_done()
+        finally:
+            await asyncio.to_thread(self._close, smtp)
@@ -0,0 +1,190 @@
+import logging
+import os
+import threading
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+from app.core.config import settings
+from app.models.schemas import MarketDataPoint
+
+logger = logging.getLogger(__name__)
+
+# Column name -> on-disk dtype. Missing optional fields are stored as NaN.
+COLUMNS: Dict[str, np.dtype] = {
+    "timestamp": np.dtype("<i8"),
+    "price": np.dtype("<f8"),
+    "volume": np.dtype("<f8"),
+    "change": np.dtype("<f8"),
+    "changePercent": np.dtype("<f8"),
+}
+
+
+def _partition_date(timestamp_ms: int) -> str:
+    try:
+        moment = datetime.fromtimestamp(timestamp_ms / 1000, tz=timezone.utc)
+    except (OverflowError, OSError, ValueError):
+        raise ValueError(f"Invalid timestamp: {timestamp_ms}")
+    return moment.strftime("%Y-%m-%d")
+
+
+class BarStore:
+    """Append-only columnar store of market bars on local disk.
+
+    Layout is ``<root>/<symbol>/<YYYY-MM-DD>/<column>.bin``: one raw
+    little-endian array per column per UTC day. Reads memory-map only the
+    columns asked for, in only the day partitions overlapping the range, and
+    locate rows with a binary search on the (sorted) timestamp column, so a
+    query touches just the pages it returns. Results from a single partition
+    are views onto the mapping (zero-copy); ranges spanning several days are
+    concatenated.
+
+    The timestamp column is written last and defines the committed row count,
+    so an interrupted append never exposes a partial row.
+    """
+
+    def __init__(self, root: str = settings.BAR_STORE_DIR):
+        self.root = root
+        self._write_lock = threading.Lock()
+        os.makedirs(self.root, exist_ok=True)
+
+    def _symbol_dir(self, symbol: str) -> str:
+        if not symbol or os.sep in symbol or symbol.startswith("."):
+            raise ValueError(f"Invalid symbol: {symbol!r}")
+        return os.path.join(self.root, symbol)
+
+    def _column_path(self, partition_dir: str, column: str) -> str:
+        return os.path.join(partition_dir, f"{column}.bin")
+
+    def _row_count(self, partition_dir: str) -> int:
+        path = self._column_path(partition_dir, "timestamp")
+        if not os.path.exists(path):
+            return 0
+        return os.path.getsize(path) // COLUMNS["timestamp"].itemsize
+
+    def _map(self, partition_dir: str, column: str, rows: int) -> np.ndarray:
+        if rows == 0:
+            return np.empty(0, dtype=COLUMNS[column])
+        return np.memmap(
+            self._column_path(partition_dir, column),
+            dtype=COLUMNS[column],
+            mode="r",
+            shape=(rows,),
+        )
+
+    def append(self, bars: Iterable[MarketDataPoint]) -> int:
+        """Append bars, grouped into their symbol/day partitions.
+
+        Bars within a batch may arrive in any order, but a partition only
+        accepts bars at or after its last stored timestamp.
+        """
+        groups: Dict[tuple, List[MarketDataPoint]] = defaultdict(list)
+        for bar in bars:
+            groups[(bar.symbol, _partition_date(bar.timestamp))].append(bar)
+
+        written = 0
+        with self._write_lock:
+            # Validate every partition first so a rejected batch writes nothing
+            row_counts = {}
+            for (symbol, day), group in groups.items():
+                group.sort(key=lambda b: b.timestamp)
+                partition_dir = os.path.join(self._symbol_dir(symbol), day)
+                rows = self._row_count(partition_dir)
+                if rows:
+                    last = self._map(partition_dir, "timestamp", rows)[-1]
+                    if group[0].timestamp < last:
+                        raise ValueError(
+                            f"Out-of-order bar for {symbol} on {day}: "
+                            f"{group[0].timestamp} < {int(last)}"
+                        )
+                row_counts[partition_dir] = rows
+
+            for (symbol, day), group in groups.items():
+                partition_dir = os.path.join(self._symbol_dir(symbol), day)
+                rows = row_counts[partition_dir]
+                os.makedirs(partition_dir, exist_ok=True)
+                data = {
+                    "timestamp": [b.timestamp for b in group],
+                    "price": [b.price for b in group],
+                    "volume": [b.volume for b in group],
+                    "change": [
+                        np.nan if b.change is None else b.change for b in group
+                    ],
+                    "changePercent": [
+                        np.nan if b.changePercent is None else b.changePercent
+                        for b in group
+                    ],
+                }
+                for column in [c for c in COLUMNS if c != "timestamp"] + ["timestamp"]:
+                    path = self._column_path(partition_dir, column)
+                    with open(path, "ab") as f:
+                        # Drop any tail left by an interrupted append
+                        f.truncate(rows * COLUMNS[column].itemsize)
+                        np.asarray(data[column], dtype=COLUMNS[column]).tofile(f)
+                written += len(group)
+        return written
+
+    def symbols(self) -> List[str]:
+        return sorted(
+            d for d in os.listdir(self.root) if os.path.isdir(os.path.join(self.root, d))
+        )
+
+    def partitions(self, symbol: str) -> List[str]:
+        symbol_dir = self._symbol_dir(symbol)
+        if not os.path.isdir(symbol_dir):
+            return []
+        return sorted(os.listdir(symbol_dir))
+
+    def read(
+        self,
+        symbol: str,
+        start: int,
+        end: int,
+        columns: Optional[List[str]] = None,
+    ) -> Dict[str, np.ndarray]:
+        """Return ``columns`` for bars of ``symbol`` with ``start <= timestamp <= end``."""
+        columns = columns or list(COLUMNS)
+        unknown = set(columns) - set(COLUMNS)
+        if unknown:
+            raise ValueError(f"Unknown columns: {sorted(unknown)}")
+        if start > end:
+            raise ValueError(f"Range start {start} is after end {end}")
+
+        first_day, last_day = _partition_date(start), _partition_date(end)
+        chunks: Dict[str, List[np.ndarray]] = {c: [] for c in columns}
+        for day in self.partitions(symbol):
+            if day < first_day or day > last_day:
+                continue
+            partition_dir = os.path.join(self._symbol_dir(symbol), day)
+            rows = self._row_count(partition_dir)
+            timestamps = self._map(partition_dir, "timestamp", rows)
+            lo = int(np.searchsorted(timestamps, start, side="left"))
+            hi = int(np.searchsorted(timestamps, end, side="right"))
+            if lo >= hi:
+                continue
+            for column in columns:
+                mapped = timestamps if column == "timestamp" else self._map(
+                    partition_dir, column, rows
+                )
+                chunks[column].append(mapped[lo:hi])
+
+        result = {}
+        for column, parts in chunks.items():
+            if not parts:
+                result[column] = np.empty(0, dtype=COLUMNS[column])
+            elif len(parts) == 1:
+                result[column] = parts[0]
+            else:
+                result[column] = np.concatenate(parts)
+        return result
+
+    def query(
+        self,
+        symbols: List[str],
+        start: int,
+        end: int,
+        columns: Optional[List[str]] = None,
+    ) -> Dict[str, Dict[str, np.ndarray]]:
+        return {symbol: self.read(symbol, start, end, columns) for symbol in symbols}
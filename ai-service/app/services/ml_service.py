@@ -6,9 +6,11 @@ import redis
 import torch
 import torch.nn as nn
 from sklearn.ensemble import RandomForestClassifier
+from sklearn.pipeline import Pipeline
 from sklearn.preprocessing import StandardScaler
 from typing import List, Dict, Any, Optional
 from app.models.schemas import MarketDataPoint
+from app.core.config import settings
 import shap
 
 logger = logging.getLogger(__name__)
@@ -17,6 +19,16 @@ logger = logging.getLogger(__name__)
 r = redis.Redis(host="localhost", port=6379, db=0)
 
 
+def label_forward_return(entry: float, exit_: float, threshold: float) -> int:
+    """Encode a forward return as a signal class (0=SELL, 1=HOLD, 2=BUY)"""
+    forward_return = (exit_ - entry) / entry if entry else 0.0
+    if forward_return > threshold:
+        return 2
+    if forward_return < -threshold:
+        return 0
+    return 1
+
+
 class TradingModel(nn.Module):
     """Simple neural network for trading signal prediction"""
 
@@ -89,12 +101,21 @@ class MLService:
         indicators: Optional[List[str]] = None,
     ) -> np.ndarray:
         """Enhancement 2 & 6: Feature extraction with custom indicators, multi-asset support"""
-        if len(historical_data) < 20:
-            return np.zeros(10)
-
         prices = [data.price for data in historical_data]
         volumes = [data.volume for data in historical_data]
-        df = pd.DataFrame({"price": prices, "volume": volumes})
+        return self.extract_features_from_columns(prices, volumes, indicators)
+
+    def extract_features_from_columns(
+        self,
+        prices: np.ndarray,
+        volumes: np.ndarray,
+        indicators: Optional[List[str]] = None,
+    ) -> np.ndarray:
+        """Feature extraction over raw price/volume columns (e.g. BarStore memmaps)"""
+        if len(prices) < 20:
+            return np.zeros(10)
+
+        df = pd.DataFrame({"price": prices, "volume": volumes}, copy=False)
 
         # Default indicators
         df["sma_10"] = df["price"].rolling(10).mean()
@@ -116,6 +137,41 @@ class MLService:
         )
         return latest_features[:10]
 
+    def build_training_frame(
+        self,
+        data: Dict[str, Dict[str, np.ndarray]],
+        lookback: int = settings.LOOKBACK_WINDOW,
+        horizon: int = settings.PREDICTION_HORIZON,
+        threshold: float = settings.ONLINE_LABEL_THRESHOLD,
+    ) -> pd.DataFrame:
+        """Supervised frame from stored bar columns (``BarStore.query`` output).
+
+        Each row holds the features of a ``lookback`` window, computed on slices
+        of the stored arrays, and a ``target`` labelled from the return over the
+        next ``horizon`` bars, as the online learner does.
+        """
+        features, targets = [], []
+        for columns in data.values():
+            prices, volumes = columns["price"], columns["volume"]
+            for start in range(len(prices) - lookback - horizon + 1):
+                end = start + lookback
+                features.append(
+                    self.extract_features_from_columns(
+                        prices[start:end], volumes[start:end]
+                    )
+                )
+                targets.append(
+                    label_forward_return(
+                        prices[end - 1], prices[end - 1 + horizon], threshold
+                    )
+                )
+        df = pd.DataFrame(
+            np.array(features).reshape(-1, 10),
+            columns=[f"feature_{i}" for i in range(10)],
+        )
+        df["target"] = targets
+        return df
+
     def _calculate_rsi(self, prices: pd.Series, period: int = 14) -> float:
         delta = prices.diff()
         gain = (delta.where(delta > 0, 0)).rolling(period).mean()
@@ -129,13 +185,25 @@ class MLService:
         historical_data: List[MarketDataPoint],
         indicators: Optional[List[str]] = None,
         multi_asset: bool = False,
+        explain: bool = True,
+        allow_stale: bool = False,
     ) -> Dict[str, Any]:
-        """Enhancements 3,5,6: caching, explainable AI, multi-asset predictions"""
+        """Enhancements 3,5,6: caching, explainable AI, multi-asset predictions
+
+        Used to degrade gracefully under load: ``explain=False`` skips SHAP,
+        and ``allow_stale=True`` returns the symbol's last full result (marked
+        ``stale``) instead of computing when the exact input is not cached.
+        """
         # Serialize input for caching
         cache_key = str([d.price for d in historical_data]) + str(indicators)
+        symbol_key = f"last_signal:{historical_data[-1].symbol}" if historical_data else None
         cached = r.get(cache_key)
         if cached:
             return eval(cached)
+        if allow_stale and symbol_key:
+            stale = r.get(symbol_key)
+            if stale:
+                return {**eval(stale), "stale": True}
 
         features = self.extract_features(historical_data, indicators)
         features = features.reshape(1, -1)
@@ -156,15 +224,29 @@ class MLService:
         }
 
         # Explainable AI via SHAP
-        explainer = shap.TreeExplainer(self.trading_model)
-        shap_values = explainer.shap_values(features)
-        result["feature_importance"] = shap_values.tolist()
+        if not explain:
+            return result
+        result["feature_importance"] = self._explain(features)
 
-        # Cache result
+        # Cache result (only complete ones, so degraded results are never served later)
         r.set(cache_key, str(result), ex=60)  # 1 minute TTL
+        if symbol_key:
+            r.set(symbol_key, str(result), ex=300)
 
         return result
 
+    def _explain(self, features: np.ndarray) -> List[Any]:
+        """SHAP for tree models; coefficient * feature contributions for linear
+        models such as the incrementally trained online snapshot"""
+        model = self.trading_model
+        if isinstance(model, Pipeline):
+            features = model[:-1].transform(features)
+            model = model[-1]
+        if hasattr(model, "coef_"):
+            return (model.coef_ * features).tolist()
+        explainer = shap.TreeExplainer(model)
+        return explainer.shap_values(features).tolist()
+
     def _generate_reasoning(
         self, signal: str, confidence: float, historical_data: List[MarketDataPoint]
     ) -> str:
@@ -0,0 +1,194 @@
+import asyncio
+import copy
+import logging
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+
+import numpy as np
+from sklearn.linear_model import SGDClassifier
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import StandardScaler
+
+from app.core.config import settings
+from app.models.schemas import MarketDataPoint
+from app.services.ml_service import label_forward_return
+
+logger = logging.getLogger(__name__)
+
+# Same class encoding as MLService signal_map: 0=SELL, 1=HOLD, 2=BUY
+CLASSES = np.array([0, 1, 2])
+
+
+class OnlineLearningService:
+    """Incrementally update a trading model from the live tick stream.
+
+    Each symbol keeps a rolling buffer of ``lookback + horizon`` bars. Once the
+    buffer is full, every new bar matures the window that ended ``horizon``
+    bars ago: its features come from the first ``lookback`` bars and its label
+    from the forward return. Matured windows go onto a bounded queue that a
+    single background worker drains with ``partial_fit``; snapshots are
+    published to ``MLService.model_registry`` every ``publish_interval``
+    seconds. Inference only ever sees published copies, so training never
+    blocks or mutates a model that is serving requests.
+    """
+
+    def __init__(
+        self,
+        ml_service,
+        lookback: int = settings.LOOKBACK_WINDOW,
+        horizon: int = settings.PREDICTION_HORIZON,
+        queue_size: int = settings.ONLINE_QUEUE_SIZE,
+        batch_size: int = settings.ONLINE_BATCH_SIZE,
+        publish_interval: float = settings.ONLINE_PUBLISH_INTERVAL,
+        label_threshold: float = settings.ONLINE_LABEL_THRESHOLD,
+        model_name: str = settings.ONLINE_MODEL_NAME,
+    ):
+        self.ml_service = ml_service
+        self.lookback = lookback
+        self.horizon = horizon
+        self.batch_size = batch_size
+        self.publish_interval = publish_interval
+        self.label_threshold = label_threshold
+        self.model_name = model_name
+
+        self.scaler = StandardScaler()
+        self.classifier = SGDClassifier(loss="log_loss", alpha=1e-4)
+        self.buffers: Dict[str, Deque[MarketDataPoint]] = {}
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        # Held while fitting or copying so a manual publish never snapshots a half-updated model
+        self._model_lock = threading.Lock()
+
+        self.snapshot_version = 0
+        self.samples_seen = 0
+        self.samples_dropped = 0
+        self.pending_since_publish = 0
+        self.last_publish = time.monotonic()
+        self._worker: Optional[asyncio.Task] = None
+
+    def start(self):
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run())
+            logger.info("Online learning worker started")
+
+    async def stop(self):
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+            logger.info("Online learning worker stopped")
+
+    def ingest(self, ticks: List[MarketDataPoint]) -> int:
+        """Buffer new bars and enqueue any windows whose label has matured.
+
+        Cheap and non-blocking: feature extraction and fitting happen on the
+        worker. When the queue is full the oldest window is dropped so memory
+        stays bounded and recent data wins.
+        """
+        matured = 0
+        for tick in ticks:
+            buffer = self.buffers.get(tick.symbol)
+            if buffer is None:
+                buffer = deque(maxlen=self.lookback + self.horizon)
+                self.buffers[tick.symbol] = buffer
+            buffer.append(tick)
+            if len(buffer) < buffer.maxlen:
+                continue
+
+            window = list(buffer)
+            if self.queue.full():
+                self.queue.get_nowait()
+                self.samples_dropped += 1
+            self.queue.put_nowait(window)
+            matured += 1
+        return matured
+
+    def _label(self, window: List[MarketDataPoint]) -> int:
+        return label_forward_return(
+            window[self.lookback - 1].price, window[-1].price, self.label_threshold
+        )
+
+    def _fit_batch(self, windows: List[List[MarketDataPoint]]):
+        X = np.vstack(
+            [self.ml_service.extract_features(w[: self.lookback]) for w in windows]
+        )
+        y = np.array([self._label(w) for w in windows])
+        with self._model_lock:
+            self.scaler.partial_fit(X)
+            self.classifier.partial_fit(self.scaler.transform(X), y, classes=CLASSES)
+
+    def _snapshot(self) -> Pipeline:
+        with self._model_lock:
+            return Pipeline(
+                [
+                    ("scaler", copy.deepcopy(self.scaler)),
+                    ("classifier", copy.deepcopy(self.classifier)),
+                ]
+            )
+
+    async def publish(self):
+        """Register a frozen copy of the current model in the MLService registry.
+
+        Copying waits on any in-flight fit, so it runs off the event loop; only
+        the registry swap happens on the loop.
+        """
+        if self.samples_seen == 0:
+            return
+        snapshot = await asyncio.to_thread(self._snapshot)
+        self.ml_service.model_registry[self.model_name] = snapshot
+        # Keep the active model current if clients switched to the online one
+        if self.ml_service.model_version == self.model_name:
+            self.ml_service.trading_model = snapshot
+        self.snapshot_version += 1
+        self.pending_since_publish = 0
+        self.last_publish = time.monotonic()
+        logger.info(
+            f"Published {self.model_name} snapshot {self.snapshot_version} "
+            f"({self.samples_seen} samples seen)"
+        )
+
+    async def _run(self):
+        while True:
+            try:
+                timeout = max(
+                    0.0, self.publish_interval - (time.monotonic() - self.last_publish)
+                )
+                try:
+                    windows = [await asyncio.wait_for(self.queue.get(), timeout)]
+                except asyncio.TimeoutError:
+                    windows = []
+                while windows and len(windows) < self.batch_size:
+                    try:
+                        windows.append(self.queue.get_nowait())
+                    except asyncio.QueueEmpty:
+                        break
+
+                if windows:
+                    await asyncio.to_thread(self._fit_batch, windows)
+                    self.samples_seen += len(windows)
+                    self.pending_since_publish += len(windows)
+
+                elapsed = time.monotonic() - self.last_publish
+                if self.pending_since_publish and elapsed >= self.publish_interval:
+                    await self.publish()
+                elif elapsed >= self.publish_interval:
+                    self.last_publish = time.monotonic()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Online learning update failed: {e}")
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "model_name": self.model_name,
+            "snapshot_version": self.snapshot_version,
+            "samples_seen": self.samples_seen,
+            "samples_dropped": self.samples_dropped,
+            "queue_depth": self.queue.qsize(),
+            "symbols_tracked": len(self.buffers),
+            "running": self._worker is not None and not self._worker.done(),
+        }
@@ -0,0 +1,111 @@
+"""Alert throughput: serial AlertService vs. batched AlertDispatcher.
+
+Starts a local aiosmtpd server as the SMTP stand-in, fires a burst of signals
+across a watchlist and reports alerts/sec for each path. Requires aiosmtpd
+(``pip install aiosmtpd``), which is not a service dependency.
+
+    cd ai-service && python -m benchmarks.alert_dispatch --signals 10000
+"""
+
+import argparse
+import asyncio
+import random
+import time
+
+from aiosmtpd.controller import Controller
+
+from app.services.alert_service import AlertDispatcher, AlertService
+
+
+class CountingHandler:
+    def __init__(self):
+        self.messages = 0
+
+    async def handle_DATA(self, server, session, envelope):
+        self.messages += 1
+        return "250 OK"
+
+
+def make_burst(n: int, recipients: int, symbols: int, seed: int = 0):
+    rng = random.Random(seed)
+    return [
+        (
+            f"trader{rng.randrange(recipients)}@example.com",
+            {
+                "symbol": f"SYM{rng.randrange(symbols)}",
+                "signal": rng.choice(["BUY", "SELL", "HOLD"]),
+                "confidence": rng.random(),
+                "reasoning": "benchmark",
+                "model_version": "bench",
+            },
+        )
+        for _ in range(n)
+    ]
+
+
+def bench_serial(email_config, burst) -> float:
+    service = AlertService(email_config)
+    start = time.perf_counter()
+    for recipient, signal_data in burst:
+        service.send_alert(recipient, signal_data)
+    return len(burst) / (time.perf_counter() - start)
+
+
+async def bench_dispatcher(email_config, burst, args) -> tuple:
+    dispatcher = AlertDispatcher(
+        email_config,
+        pool_size=args.pool_size,
+        queue_size=len(burst),
+        coalesce_window=args.window,
+        rate_limit=0,
+    )
+    await dispatcher.start()
+    start = time.perf_counter()
+    for recipient, signal_data in burst:
+        dispatcher.submit(recipient, signal_data)
+    await dispatcher.stop()
+    elapsed = time.perf_counter() - start
+    # Only delivered alerts count; deduplicated signals are reported separately
+    return dispatcher.metrics["alerts_sent"] / elapsed, dispatcher.metrics
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--signals", type=int, default=10000)
+    parser.add_argument("--recipients", type=int, default=50)
+    parser.add_argument("--symbols", type=int, default=200)
+    parser.add_argument("--pool-size", type=int, default=4)
+    parser.add_argument("--window", type=float, default=0.1, help="coalesce window (s)")
+    parser.add_argument(
+        "--serial-limit",
+        type=int,
+        default=1000,
+        help="signals sent through the serial path (it is too slow for the full burst)",
+    )
+    parser.add_argument("--port", type=int, default=8025)
+    args = parser.parse_args()
+
+    handler = CountingHandler()
+    controller = Controller(handler, hostname="127.0.0.1", port=args.port)
+    controller.start()
+    email_config = {"from": "bench@tradesync.local", "smtp_server": "127.0.0.1", "smtp_port": args.port}
+    burst = make_burst(args.signals, args.recipients, args.symbols)
+
+    try:
+        serial_rate = bench_serial(email_config, burst[: args.serial_limit])
+        serial_messages = handler.messages
+        print(f"serial AlertService:   {serial_rate:10.1f} alerts/s "
+              f"({args.serial_limit} signals, {serial_messages} messages)")
+
+        handler.messages = 0
+        rate, metrics = asyncio.run(bench_dispatcher(email_config, burst, args))
+        print(f"AlertDispatcher:       {rate:10.1f} alerts/s "
+              f"({metrics['alerts_sent']} delivered in {handler.messages} messages)")
+        print(f"  deduplicated:        {metrics['deduplicated']} of {args.signals} signals "
+              f"(not counted in alerts/s)")
+    finally:
+        controller.stop()
+
+
+if __name__ == "__main__":
+    main()